@@ -4,7 +4,7 @@ from textwrap import dedent
 from lark import Lark, Transformer
 from lark.indenter import Indenter
 
-from .managers import colors, ScreenManager
+from .managers import colors, get_screen_manager
 from .widgets import Widget
 
 
@@ -97,5 +97,5 @@ def load_string(build_string, globals={ }, *, root=True):
     parser = Lark(GRAMMAR, parser='lalr', postlex=LayoutIndenter(), transformer=builder)
     layout = parser.parse(dedent(build_string))
     if root:
-        ScreenManager().root.add_widget(layout)
+        get_screen_manager().root.add_widget(layout)
     return builder.widgets
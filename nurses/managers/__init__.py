@@ -1,4 +1,4 @@
-from .screen_manager import ScreenManager
+from .screen_manager import ScreenManager, get_screen_manager
 from .color_manager import ColorManager
 
 colors = ColorManager()
@@ -44,6 +44,7 @@ class ColorManager(metaclass=Singleton):
         self._names_to_rgb = dict(zip(DEFAULT_COLORS, DEFAULT_RGBS))
         self._rgb_to_curses = defaultdict(count(INIT_COLOR_START).__next__, zip(DEFAULT_RGBS, count()))
         self._pair_to_curses = defaultdict(count(1).__next__, {(DEFAULT_RGBS[-1], DEFAULT_RGBS[0]): 0})
+        self._pair_to_attr = { }  # Cache of `curses.color_pair` results
         self.palette = defaultdict(list)
 
     def rainbow_gradient(self, n=20, background="BLACK", palette="rainbow"):
@@ -115,13 +116,18 @@ class ColorManager(metaclass=Singleton):
         pair will be appended to `self.palette[palette]`.  This can simplify creating color gradients.
         """
         pair = fore, back
-        pairs = self._pair_to_curses
-        color = self.color
+        attrs = self._pair_to_attr
 
-        if pair not in pairs:
-            curses.init_pair(pairs[pair], color(fore), color(back))
+        if pair not in attrs:
+            pairs = self._pair_to_curses
+            color = self.color
 
-        color_pair = curses.color_pair(pairs[pair])
+            if pair not in pairs:
+                curses.init_pair(pairs[pair], color(fore), color(back))
+
+            attrs[pair] = curses.color_pair(pairs[pair])
+
+        color_pair = attrs[pair]
 
         if palette is not None:
             self.palette[palette].append(color_pair)
@@ -132,6 +138,10 @@ class ColorManager(metaclass=Singleton):
         """
         Fetch the color pair (FOREGROUND, BACKGROUND) with attribute FOREGROUND_ON_BACKGROUND.
         Alternatively, if called with just a single color, return the color's rgb-tuple.
+
+        Notes
+        -----
+        Color pairs are cached as instance attributes, so only the first lookup of a name reaches this method.
         """
         names = self._names_to_rgb
 
@@ -142,7 +152,9 @@ class ColorManager(metaclass=Singleton):
             if back not in names:
                 raise ValueError(f"{back} not defined")
 
-            return self.pair(names[fore], names[back])
+            color_pair = self.pair(names[fore], names[back])
+            super().__setattr__(attr, color_pair)
+            return color_pair
 
         if COLOR_RE.fullmatch(attr):
             return names[attr]
@@ -163,5 +175,9 @@ class ColorManager(metaclass=Singleton):
 
         self._names_to_rgb[color] = rgb
 
+        for name in tuple(vars(self)):  # Drop cached color pairs that use the old alias
+            if (match := COLOR_PAIR_RE.fullmatch(name)) and color in match.groups():
+                delattr(self, name)
+
     def __str__(self):
         return f"Current aliases: {', '.join(self._names_to_rgb) or 'None'}\nCurrent palettes: {', '.join(self.palette) or 'None'}"
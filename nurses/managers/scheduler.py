@@ -1,10 +1,26 @@
 from collections import deque
 from heapq import heappop, heappush
-from textwrap import dedent
-from time import monotonic, sleep
+from itertools import count
+from time import monotonic_ns, sleep
 from types import coroutine
 
 
+async def _call_forever(func, args, kwargs, wait, wait_args):
+    while True:
+        func(*args, **kwargs)
+        await wait(*wait_args)
+
+async def _call_n(n, func, args, kwargs, wait, wait_args):
+    for _ in range(n):
+        func(*args, **kwargs)
+        await wait(*wait_args)
+
+async def _iterate(iterable, wait, wait_args):
+    for i in iterable:
+        yield i
+        await wait(*wait_args)
+
+
 class Task:
     __slots__ = "scheduler", "coro", "is_canceled", "deadline", "is_rescheduled", "result"
 
@@ -40,21 +56,25 @@ class Task:
         self.is_rescheduled = True
         return self.scheduler.new_task(self.coro)
 
-    def __lt__(self, other):
-        return self.deadline < other.deadline
-
 
 class Scheduler:
-    __slots__ = "ready", "sleeping", "current"
+    """
+    Notes
+    -----
+    `sleeping` is a heap of `(deadline, seq, task)` entries: ties on deadline are broken by the increasing `seq`, so
+    tasks never need to be compared and tasks with the same deadline wake in the order they went to sleep.
+    """
+    __slots__ = "ready", "sleeping", "current", "_seq"
 
     def __init__(self):
         self.ready = deque()
         self.sleeping = [ ]
         self.current = None
+        self._seq = count()
 
     async def sleep(self, delay):
-        self.current.deadline = monotonic() + delay
-        heappush(self.sleeping, self.current)
+        self.current.deadline = monotonic_ns() + int(delay * 1e9)  # Integer nanosecond deadlines
+        heappush(self.sleeping, (self.current.deadline, next(self._seq), self.current))
         self.current = None
         await self.next_task()
 
@@ -79,16 +99,19 @@ class Scheduler:
         sleeping = self.sleeping
 
         while ready or sleeping:
-            now = monotonic()
+            now = monotonic_ns()
 
-            while sleeping and sleeping[0].deadline <= now:
-                ready.append(heappop(sleeping))
+            if sleeping and sleeping[0][0] <= now:
+                expired = [ ]
+                while sleeping and sleeping[0][0] <= now:
+                    expired.append(heappop(sleeping)[-1])
+                ready.extend(expired)
 
             if ready:
                 self.current = ready.popleft()
             else:
-                self.current = heappop(sleeping)
-                sleep(self.current.deadline - now)
+                *_, self.current = heappop(sleeping)
+                sleep((self.current.deadline - now) / 1e9)
 
             if self.current.is_canceled:
                 continue
@@ -104,24 +127,15 @@ class Scheduler:
     def aiter(self, iterable, *args, delay=0, n=0, **kwargs):
         """Utility function: wraps a callable in a coroutine or creates an async iterator from an iterable.
         """
-        if callable(iterable):
-            loop = f"for _ in range({n})" if n else "while True"
-            body = "iterable(*args, **kwargs)"
-        else:
-            loop = "for i in iterable"
-            body = "yield i"
-
-        awaitable = f"self.sleep({delay})" if delay > 0 else "self.next_task()"
-
-        code = f"""
-            async def wrapped():
-                {loop}:
-                    {body}
-                    await {awaitable}
-        """
+        wait, wait_args = (self.sleep, (delay, )) if delay > 0 else (self.next_task, ())
+
+        if not callable(iterable):
+            return _iterate(iterable, wait, wait_args)
+
+        if n:
+            return _call_n(n, iterable, args, kwargs, wait, wait_args)
 
-        exec(dedent(code), locals(), loc := { })
-        return loc["wrapped"]()
+        return _call_forever(iterable, args, kwargs, wait, wait_args)
 
     def schedule(self, callable, *args, delay=0, n=0, **kwargs):
         """
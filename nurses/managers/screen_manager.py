@@ -1,22 +1,41 @@
 import curses
+from time import monotonic_ns
 
-from .meta import Singleton
 from .scheduler import Scheduler
 from ..widgets import Root
 from .. import ESCAPE
 
 EXIT = ESCAPE
+MAX_TIMEOUT = 2**31 - 1  # `window.timeout` takes a C int of milliseconds
 
+_INSTANCE = None
 
-class ScreenManager(Scheduler, metaclass=Singleton):
+def get_screen_manager():
+    """Return the ScreenManager, creating it on first use.  Prefer this to `ScreenManager()` inside the library.
+    """
+    return ScreenManager() if _INSTANCE is None else _INSTANCE
+
+
+class ScreenManager(Scheduler):
     """
     ScreenManager starts and closes curses, handles events (getching for now, hopefully mouse
     input in the future), and schedules and runs coroutines.
+
+    Notes
+    -----
+    There can be only one: calling `ScreenManager()` again returns the existing instance.
     """
 
     __slots__ = "screen", "root"
 
+    def __new__(cls):
+        return super().__new__(cls) if _INSTANCE is None else _INSTANCE
+
     def __init__(self):
+        global _INSTANCE
+        if _INSTANCE is self:
+            return
+
         self.screen = screen = curses.initscr()
         screen.keypad(True)
         screen.nodelay(True)
@@ -28,6 +47,7 @@ class ScreenManager(Scheduler, metaclass=Singleton):
         self.root = Root(screen=screen)  # Top-level widget: getch dispatching will start here.
 
         super().__init__()
+        _INSTANCE = self
 
     def pause(self):
         """A blocking getch.
@@ -39,11 +59,22 @@ class ScreenManager(Scheduler, metaclass=Singleton):
         return key
 
     async def getch(self):
+        """
+        Poll for key presses between tasks.  When no other task is ready, block on input until
+        the next sleeping task is due instead of spinning the event loop.
+        """
+        screen = self.screen
         while True:
             if not self.ready and not self.sleeping:
                 return
 
-            key = self.screen.getch()
+            if self.ready:
+                screen.timeout(0)
+            else:
+                ms = -(-(self.sleeping[0][0] - monotonic_ns()) // 1_000_000)  # Round up so we don't wake just before the deadline
+                screen.timeout(min(max(0, ms), MAX_TIMEOUT))
+
+            key = screen.getch()
             if key == EXIT:
                 self.ready.clear()
                 self.sleeping.clear()
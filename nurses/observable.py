@@ -32,11 +32,12 @@ class Observable:
         if instance is None:
             return self
 
-        if instance in self.getters:
+        if self.getters and instance in self.getters:
             return self.getters[instance]()
 
-        if self.name in instance.__dict__:
-            return instance.__dict__[self.name]
+        value = instance.__dict__.get(self.name, NO_DEFAULT)
+        if value is not NO_DEFAULT:
+            return value
 
         if self.default is not NO_DEFAULT:
             return self.default
@@ -44,16 +45,18 @@ class Observable:
         return self
 
     def dispatch(self, instance):
-        # Build list of dispatches from _mro_ if it doesn't exist
-        name = type(instance).__name__
-        if name not in self.callbacks:
+        cls = type(instance)
+        callbacks = self.callbacks.get(cls)
+
+        if callbacks is None:  # Build tuple of dispatches from _mro_
             d = { }
-            for base in reversed(type(instance).__mro__):
+            for base in reversed(cls.__mro__):
                 d.update(self.methods.get(base.__name__, { }))
-            self.callbacks[name] = list(d)
+            callbacks = self.callbacks[cls] = tuple(d)
 
-        for callback in self.callbacks[name]:
+        for callback in callbacks:
             getattr(instance, callback)()
 
     def bind(self, class_name, method_name):
         self.methods[class_name][method_name] = None
+        self.callbacks.clear()
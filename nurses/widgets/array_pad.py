@@ -159,4 +159,8 @@ class ArrayPad(ArrayWin):
             des_h = min(h - 1, des_t + widget.height)
             des_w = min(w - 1, des_l + widget.width - 1)
 
+            if src_t >= widget.height or src_l >= widget.width or des_h < des_t or des_w < des_l:
+                continue  # Widget is entirely out-of-bounds
+
             widget.overlay(self.window, src_t, src_l, des_t, des_l, des_h, des_w)
+            self.invalidate((slice(des_t, des_h + 1), slice(des_l, des_w + 1)))  # Re-write cells beneath children next push
@@ -4,6 +4,40 @@ import numpy as np
 
 from .widget import Widget, BORDER_STYLES
 
+# Control characters are interpreted by curses (newlines clear the rest of the line, tabs expand, nulls are refused...),
+# which would shift or break a run, so they're written as spaces.
+UNPRINTABLE = dict.fromkeys((*range(0x20), 0x7f), " ")
+
+def codepoints(array):
+    """
+    Return a character array as an array of unicode codepoints.  `<U1` arrays are already stored as
+    little-endian UCS-4, so this is usually a view and no copy is made.
+    """
+    return np.ascontiguousarray(array, dtype="<U1").view("<u4")
+
+def dirty_runs(buffer, colors, prev_buffer, prev_colors):
+    """
+    Find every run of consecutive changed cells that share a color.  Returns the runs' rows, starts and
+    (exclusive) ends as lists.  Runs never span rows.
+    """
+    dirty = (buffer != prev_buffer) | (colors != prev_colors)
+    color_breaks = colors[:, 1:] != colors[:, :-1]
+
+    starts = dirty.copy()
+    starts[:, 1:] &= ~dirty[:, :-1] | color_breaks
+
+    ends = dirty.copy()
+    ends[:, :-1] &= ~dirty[:, 1:] | color_breaks
+
+    rows, start_xs = np.nonzero(starts)
+    end_xs = np.nonzero(ends)[1] + 1
+    return rows.tolist(), start_xs.tolist(), end_xs.tolist()
+
+def row_text(row):
+    """Decode a row of codepoints into a single printable string.
+    """
+    return row.tobytes().decode("utf-32-le").translate(UNPRINTABLE)
+
 
 class ArrayWin(Widget):
     """
@@ -28,6 +62,8 @@ class ArrayWin(Widget):
         super().__init__(*args, **kwargs)
         self._buffer = None
         self._colors = None
+        self._prev_buffer = None
+        self._prev_colors = None
 
     def update_geometry(self):
         if self.root is None:
@@ -66,7 +102,7 @@ class ArrayWin(Widget):
             self._buffer = array
 
     def _resize(self):
-        if self.window is None:
+        if self.window is None or self._buffer.shape == (self.height, self.width):  # Size unchanged
             return
 
         if self.has_border:
@@ -86,28 +122,57 @@ class ArrayWin(Widget):
         self._colors = new_colors
 
         super()._resize()
+        self.invalidate()
 
         if self.has_border:
             self.border(self.border_style, self.border_color)
 
     def push(self):
         """Write the buffers to the window.
+
+        Notes
+        -----
+        Only cells that changed since the last push are written, as runs of same-colored characters
+        (one `addstr` per run).  A copy of the last pushed buffers is kept in `_prev_buffer` (as codepoints)
+        and `_prev_colors`.
         """
-        it = np.nditer((self._buffer, self._colors), ["multi_index"])
-        for char, color in it:
+        buffer, colors = codepoints(self._buffer), self._colors
+        prev_buffer, prev_colors = self._prev_buffer, self._prev_colors
+
+        if prev_buffer is None or prev_buffer.shape != buffer.shape:
+            prev_buffer = self._prev_buffer = buffer.copy()
+            prev_colors = self._prev_colors = np.full_like(colors, -1)  # Color pairs are never negative, so every cell is dirty.
 
-            # Newline character on the last corner of a window will advance the cursor out-of-bounds causing an error
-            # TODO: Implement a more perfomant solution, either check the index, catch the error, or add an extra row to the windows
-            if (ch := str(char)) == "\n":
-                ch = " "
+        window = self.window
+        text_y = None
+        for y, start, end in zip(*dirty_runs(buffer, colors, prev_buffer, prev_colors)):
+            if y != text_y:
+                text, text_y = row_text(buffer[y]), y
+            window.addstr(y, start, text[start: end], int(colors[y, start]))
 
-            y, x = it.multi_index
-            self.window.addstr(y, x, ch, color)
+        np.copyto(prev_buffer, buffer)
+        np.copyto(prev_colors, colors)
+
+    def invalidate(self, key=...):
+        """
+        Force cells of the window to be re-written on the next push.  `key` indexes the window (borders included),
+        by default the entire window is invalidated.  Call this after drawing directly on `window`.
+        """
+        if self._prev_colors is not None:
+            self._prev_colors[key] = -1
 
     def refresh(self):
         self.push()
         super().refresh()
 
+        # Children were drawn over our window, so the cells beneath them need to be re-written next push.
+        for widget in self.children:
+            if widget is None or not widget._overlay_bounds:  # Out-of-bounds children weren't drawn
+                continue
+
+            *_, des_t, des_l, des_h, des_w = widget._overlay_bounds
+            self.invalidate((slice(des_t, des_h + 1), slice(des_l, des_w + 1)))
+
     def __getitem__(self, key):
         """
         `buffer.__getitem__` except offset if `self.has_border` is true
@@ -168,8 +233,8 @@ class ArrayWin(Widget):
         ul, ur, v, h, ll, lr = BORDER_STYLES[style]
 
         b = self._buffer
-        b[(0, -1), :] = h
-        b[:, (0, -1)] = v
+        b[0] = b[-1] = h
+        b[:, 0] = b[:, -1] = v
         b[ 0,  0] = ul
         b[ 0, -1] = ur
         b[-1,  0] = ll
@@ -190,9 +255,22 @@ class ArrayWin(Widget):
         vertical: optional
             Whether to roll vertically.  (the default is `False`, i.e., rolls are horizontal by default)
         """
-        axis = (-shift, 0) if vertical else (0, -shift)
-        self.buffer = np.roll(self.buffer, axis, (0, 1))
-        self.colors = np.roll(self.colors, axis, (0, 1))
+        buffer, colors = self.buffer, self.colors
+        if not vertical:
+            buffer, colors = buffer.T, colors.T
+
+        if len(buffer) == 0:  # e.g., the inside of a bordered widget of height or width 2
+            return
+
+        shift %= len(buffer)
+        if shift == 0:
+            return
+
+        # In-place rotation: only the `shift` lines that wrap around need a temporary copy.
+        for array in (buffer, colors):
+            wrapped = array[:shift].copy()
+            array[:-shift] = array[shift:]
+            array[-shift:] = wrapped
 
     def scroll(self, lines=1):
         """
@@ -203,7 +281,23 @@ class ArrayWin(Widget):
         lines: optional
             Number of lines to scroll. To scroll down, lines should be negative. (the default is 1)
         """
-        self.roll(lines, vertical=True)
-        slice_ = slice(-lines, None) if lines > 0 else slice(None, -lines)
-        self.buffer[slice_] = self.default_character
-        self.colors[slice_] = self.color
+        buffer, colors = self.buffer, self.colors
+
+        if abs(lines) >= len(buffer):
+            buffer[:] = self.default_character
+            colors[:] = self.color
+            return
+
+        if lines > 0:
+            buffer[:-lines] = buffer[lines:]
+            colors[:-lines] = colors[lines:]
+            slice_ = slice(-lines, None)
+        elif lines < 0:
+            buffer[-lines:] = buffer[:lines]
+            colors[-lines:] = colors[:lines]
+            slice_ = slice(None, -lines)
+        else:
+            return
+
+        buffer[slice_] = self.default_character
+        colors[slice_] = self.color
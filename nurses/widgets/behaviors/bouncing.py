@@ -2,30 +2,48 @@ class Bouncing:
     """After `schedule_bounce` is called widget will move according to its `vel` attribute, bouncing off its parent's boundaries.
     """
 
-    vel = 1 + 1j
+    _vy = _vx = 1.0  # vel = 1 + 1j
     delay = .3
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.pos = complex(self.top, self. left)
+        self.pos = complex(self.top, self.left)
+
+    @property
+    def vel(self):
+        return complex(self._vy, self._vx)
+
+    @vel.setter
+    def vel(self, vel):
+        self._vy, self._vx = vel.real, vel.imag
+
+    @property
+    def pos(self):
+        return complex(self._py, self._px)
+
+    @pos.setter
+    def pos(self, pos):
+        self._py, self._px = pos.real, pos.imag
 
     def schedule_bounce(self):
-        from ... import ScreenManager
-        self.bounce = ScreenManager().schedule(self._bounce, delay=self.delay)
+        from ...managers import get_screen_manager
+        self.bounce = get_screen_manager().schedule(self._bounce, delay=self.delay)
 
     def _bounce(self):
-        self.pos += self.vel
+        py = self._py + self._vy
+        px = self._px + self._vx
 
         offset = int(self.parent.has_border)
-        h, w = self.parent.height - 2 * offset, self.parent.width - 2 * offset
 
-        if not 0 <= self.pos.real <= h - self.height:
-            self.vel = -self.vel.conjugate()
-            self.pos += 2 * self.vel.real
+        if not 0 <= py <= self.parent.height - 2 * offset - self.height:
+            self._vy = -self._vy
+            py += 2 * self._vy
 
-        if not 0 <= self.pos.imag <= w - self.width:
-            self.vel = self.vel.conjugate()
-            self.pos += 2j * self.vel.imag
+        if not 0 <= px <= self.parent.width - 2 * offset - self.width:
+            self._vx = -self._vx
+            px += 2 * self._vx
 
-        self.top = round(self.pos.real)
-        self.left = round(self.pos.imag)
+        self._py = py
+        self._px = px
+        self.top = round(py)
+        self.left = round(px)
@@ -23,6 +23,7 @@ class Grid(Layout):
             raise ValueError("need both row and col")
 
         widget.parent = self
+        widget._overlay_bounds = None  # Bounds depend on the parent
         widget.update_geometry()
 
     def update_geometry(self):
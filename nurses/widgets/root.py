@@ -29,6 +29,7 @@ class Root(Widget):
         h, w = self.window.getmaxyx()
         self.height = h
         self.width = w - 1
+        self._reset_children_overlay_bounds()  # Root's height and width aren't Observables
 
         for child in self.children:
             child.update_geometry()
@@ -493,6 +493,7 @@ class TextPad(ArrayPad):
                 for y, x in np.argwhere(self.pad == "\n"):
                     if start <= (y, x) < end and row <= y < row + h and col <= x < col + w:
                         self.window.chgat(offset + y - row, offset + x - col, 1, self.selected_color)  # Show selected new lines
+                        self.invalidate((offset + y - row, offset + x - col))
                 return  # We won't draw cursor if there's a selection, so return early.
 
             self.unselect()
@@ -501,3 +502,5 @@ class TextPad(ArrayPad):
             self.window.addstr(offset + self._cursor_y, offset + self._cursor_x, self.cursor, self.cursor_color)
         else:
             self.window.chgat(offset + self._cursor_y, offset + self._cursor_x, 1, self.cursor_color)
+
+        self.invalidate((offset + self._cursor_y, offset + self._cursor_x))  # Cursor is drawn over the buffer, so re-write it next push
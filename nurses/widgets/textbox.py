@@ -39,8 +39,8 @@ class Textbox(Widget):
     async def gather(self):
         self._gathering = True
 
-        from .. import ScreenManager  # We need the event loop, but we need to defer this import to avoid a circular import.
-        sm = ScreenManager()
+        from ..managers import get_screen_manager  # We need the event loop, but we need to defer this import to avoid a circular import.
+        sm = get_screen_manager()
 
         self.root.refresh()
 
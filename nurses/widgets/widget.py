@@ -53,13 +53,17 @@ class Observer(type):
     This metaclass simply drops the `bind_to` decorator into the class dict.
     `bind_to` allows one to quickly bind functions to attributes in the class body - these attributes
     will be turned into Observables by the decorator.
+
+    The names of all class attributes at creation are collected in `_attr_names` to speed up setting them with keyword-arguments.
     """
     def __prepare__(name, bases):
         return { "bind_to": BindMagic }
 
     def __new__(meta, name, bases, methods):
         del methods["bind_to"]
-        return super().__new__(meta, name, bases, methods)
+        cls = super().__new__(meta, name, bases, methods)
+        cls._attr_names = frozenset(dir(cls))
+        return cls
 
 
 class Widget(metaclass=Observer):
@@ -105,6 +109,9 @@ class Widget(metaclass=Observer):
     pos_hint = None, None
     size_hint = None, None
 
+    _overlay_bounds = None  # Cached arguments to `overlay`, computed by the parent's `refresh`.
+    _has_getters = False
+
     def __init_subclass__(cls):
         Widget.types[cls.__name__] = cls  # Register subclasses
 
@@ -124,9 +131,10 @@ class Widget(metaclass=Observer):
         self.height = height
         self.width = width
 
+        attr_names = type(self)._attr_names
         for attr in tuple(kwargs):
             # This allows one to set class attributes with keyword-arguments. TODO: Document this.
-            if hasattr(self, attr):
+            if attr in attr_names or hasattr(self, attr):  # Names added to classes after creation aren't in `_attr_names`
                 setattr(self, attr, kwargs.pop(attr))
 
         super().__init__(*rest, **kwargs)
@@ -143,11 +151,13 @@ class Widget(metaclass=Observer):
 
         ::Warning:: This modifies the class dictionary, replacing any non-Observable attribute with an Observable.
         """
-        observable = getattr(type(self), name, None)
+        cls = type(self)
+        observable = getattr(cls, name, None)
         if not isinstance(observable, Observable):
-            setattr(type(self), name, observable := Observable(observable))
+            setattr(cls, name, observable := Observable(observable))
 
         observable.getters[self] = getter
+        self._has_getters = True  # Getters don't dispatch, so overlay bounds can't be cached.
 
     @bind_to("top")
     def _set_pos_hint_y(self):
@@ -165,6 +175,16 @@ class Widget(metaclass=Observer):
     def _set_size_hint_x(self):
         self.size_hint = self.size_hint[0], None
 
+    @bind_to("top", "left", "height", "width")
+    def _reset_overlay_bounds(self):
+        self._overlay_bounds = None
+
+    @bind_to("height", "width", "border_style")
+    def _reset_children_overlay_bounds(self):
+        for child in self.children:
+            if child is not None:
+                child._overlay_bounds = None
+
     def update_geometry(self):
         """
         Set or reset the widget's geometry based on size or pos hints if they exist.
@@ -216,7 +236,7 @@ class Widget(metaclass=Observer):
     def _resize(self):
         window = self.window
 
-        if not window:
+        if not window or window.getmaxyx() == (self.height, self.width + 1):  # Size unchanged
             return
 
         if self.has_border:  # Erase the right-most, lower-most border in case widget expands
@@ -292,6 +312,7 @@ class Widget(metaclass=Observer):
     def add_widget(self, widget):
         self.children.append(widget)
         widget.parent = self
+        widget._overlay_bounds = None  # Bounds depend on the parent
         widget.update_geometry()
 
     def remove_widget(self, widget):
@@ -324,20 +345,29 @@ class Widget(metaclass=Observer):
         """
         # Notably, we don't use curses.panels as they aren't available for windows-curses...
         # ...upside is we don't error when moving a widget off-screen.
-        border = int(self.has_border)
-        h, w = self.height, self.width
+        has_getters = self._has_getters
         for widget in self.children:
             if widget is None:
                 continue
 
             widget.refresh()
-            y, x = widget.top, widget.left
-            src_t, des_t = (-y, border) if y < 0 else (0, y + border)
-            src_l, des_l = (-x, border) if x < 0 else (0, x + border)
-            des_h = min(h - 1, des_t + widget.height)
-            des_w = min(w - 1, des_l + widget.width - 1)  # -1 compensates for the extra width of widget's window
 
-            widget.overlay(self.window, src_t, src_l, des_t, des_l, des_h, des_w)  # FIXME: This is causing an error on WSL terminal.
+            bounds = widget._overlay_bounds
+            if bounds is None or has_getters or widget._has_getters:
+                border = int(self.has_border)
+                y, x = widget.top, widget.left
+                src_t, des_t = (-y, border) if y < 0 else (0, y + border)
+                src_l, des_l = (-x, border) if x < 0 else (0, x + border)
+                des_h = min(self.height - 1, des_t + widget.height)
+                des_w = min(self.width - 1, des_l + widget.width - 1)  # -1 compensates for the extra width of widget's window
+
+                if src_t >= widget.height or src_l >= widget.width or des_h < des_t or des_w < des_l:
+                    bounds = widget._overlay_bounds = ()  # Widget is entirely out-of-bounds, nothing to overlay
+                else:
+                    bounds = widget._overlay_bounds = src_t, src_l, des_t, des_l, des_h, des_w
+
+            if bounds:
+                widget.overlay(self.window, *bounds)  # FIXME: This is causing an error on WSL terminal.
 
     @staticmethod
     def convert(value, bounds):
@@ -426,14 +456,9 @@ class Widget(metaclass=Observer):
         ul, ur, v, hor, ll, lr = BORDER_STYLES[style]
         color = color or self.color
 
-        window.addstr(0, 0, ul, color)
-        window.addstr(0, w, ur, color)
-        window.addstr(h, 0, ll, color)
-        window.addstr(h, w, lr, color)
-
-        for x in range(1, w):
-            window.addstr(0, x, hor, color)
-            window.addstr(h, x, hor, color)
+        # Horizontal edges are written a whole row at a time. (Slicing handles a width of 1, where corners overlap.)
+        window.addstr(0, 0, (ul + hor * (w - 1) + ur)[-w - 1:], color)
+        window.addstr(h, 0, (ll + hor * (w - 1) + lr)[-w - 1:], color)
 
         for y in range(1, h):
             window.addstr(y, 0, v, color)